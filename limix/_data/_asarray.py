@@ -29,6 +29,10 @@ def asarray(x, target, dims=None):
 
     if not is_dataarray(x):
         x = DataArray(x)
+    else:
+        # Callers name and assign coordinates to the returned array, which must
+        # not reach the user's object. A shallow copy still shares the data.
+        x = x.copy(deep=False)
 
     x.name = target
 
@@ -41,22 +45,40 @@ def asarray(x, target, dims=None):
             dim = "dim_{}".format(x.ndim)
         x = x.expand_dims(dim, x.ndim)
 
+    target_dims = tuple(CONF["data_dims"][target])
+    if dims is not None or x.dims != target_dims:
+        x = _conform_dims(x, dims, target_dims)
+
+    if issubdtype(x.dtype, integer):
+        x = x.astype(float)
+
+    for dim in x.dims:
+        if x.coords[dim].dtype.kind in {"U", "S"}:
+            x.coords[dim].values = x.coords[dim].values.astype(object)
+
+    return x
+
+
+def _conform_dims(x, dims, target_dims):
     if isinstance(dims, (tuple, list)):
         dims = {a: n for a, n in enumerate(dims)}
     dims = _numbered_axes(dims)
     if len(set(dims.values())) < len(dims.values()):
         raise ValueError("`dims` must not contain duplicated values.")
 
-    x = x.rename({x.dims[axis]: name for axis, name in dims.items()})
-    x = _set_missing_dim(x, CONF["data_dims"][target])
-    x = x.transpose(*CONF["data_dims"][target])
+    renames = {x.dims[axis]: name for axis, name in dims.items()}
+    new_dims = tuple(renames.get(d, d) for d in x.dims)
+    missing = _missing_dim(new_dims, target_dims)
 
-    if issubdtype(x.dtype, integer):
-        x = x.astype(float)
+    # Apply the user-provided names and the inferred missing one in a single go,
+    # leaving out the dimensions whose names do not change.
+    renames = dict(zip(x.dims, (missing.get(d, d) for d in new_dims)))
+    renames = {old: new for old, new in renames.items() if old != new}
+    if len(renames) > 0:
+        x = x.rename(renames)
 
-    for dim in x.dims:
-        if x.coords[dim].dtype.kind in {"U", "S"}:
-            x.coords[dim].values = x.coords[dim].values.astype(object)
+    if x.dims != target_dims:
+        x = x.transpose(*target_dims)
 
     return x
 
@@ -78,13 +100,14 @@ def _numbered_axes(dims):
     return naxes
 
 
-def _set_missing_dim(arr, dims):
-    unk_dims = set(arr.dims) - set(dims)
+def _missing_dim(arr_dims, dims):
+    unk_dims = [d for d in arr_dims if d not in dims]
+    if len(unk_dims) == 0:
+        return {}
     if len(unk_dims) > 1:
         raise ValueError("Too many unknown dimension names.")
-    elif len(unk_dims) == 1:
-        known_dims = set(dims) - set(arr.dims)
-        if len(known_dims) != 1:
-            raise ValueError("Can't figure out what is the missing dimension name.")
-        arr = arr.rename({unk_dims.pop(): known_dims.pop()})
-    return arr
+
+    known_dims = [d for d in dims if d not in arr_dims]
+    if len(known_dims) != 1:
+        raise ValueError("Can't figure out what is the missing dimension name.")
+    return {unk_dims[0]: known_dims[0]}
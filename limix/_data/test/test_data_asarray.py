@@ -37,6 +37,13 @@ def test_asarray():
     _assert_target(
         asarray(xr.DataArray(arr, dims=["sample", "trait"]), "trait"), "trait"
     )
+    x = xr.DataArray(arr, dims=["sample", "trait"])
+    y = asarray(x, "trait")
+    assert y is not x
+    assert np.shares_memory(y.values, x.values)
+    y.coords["trait"] = ["t0", "t1", "t2"]
+    assert "trait" not in x.coords
+    assert x.name is None
     _assert_target(
         asarray(xr.DataArray(arr, dims=["sample", "dim2"]), "trait"), "trait"
     )
@@ -7,11 +7,9 @@ def draw_title(title):
 def draw_dataframe(title, df):
     msg = repr(df)
     k = msg.find("\n") - len(title) - 2
-    left = ("-" * (k // 2)) + " "
-    right = " " + ("-" * (k // 2 + k % 2))
-    out = left + title + right + "\n"
-    out += msg
-    return out
+    left = "-" * (k // 2)
+    right = "-" * (k // 2 + k % 2)
+    return f"{left} {title} {right}\n{msg}"
 
 
 def draw_list(x, n):
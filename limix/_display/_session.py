@@ -1,5 +1,5 @@
 import sys
-from time import time
+from time import perf_counter
 
 from ._core import blue, bold, pprint, red, width, wrap_text
 
@@ -16,32 +16,34 @@ class session_line:
         self.elapsed = None
 
     def __enter__(self):
-        self._tstart = time()
+        self._tstart = perf_counter()
         if not self._disable:
             sys.stdout.write(self._desc)
             sys.stdout.flush()
         return self
 
     def __exit__(self, exception_type, exception_value, traceback):
+        self.elapsed = perf_counter() - self._tstart
+        if self._disable:
+            return
+
         from humanfriendly import format_timespan
         from limix.__config__ import get_info
 
-        self.elapsed = time() - self._tstart
         fail = exception_type is not None
 
-        if not self._disable:
-            if get_info("rich_text") and not get_info("building_doc"):
-                # New line, get back to previous line, and advance cursor to the end
-                # of the line. This allows us to always get back to the right cursor
-                # position, as long as the cursor is still in the correct line.
-                print("\n\033[1A\033[{}C".format(len(self._desc)), end="")
-            if fail:
-                msg = bold(red("failed"))
-                msg += " ({}).".format(format_timespan(self.elapsed))
-                pprint(msg)
-            else:
-                print("done (%s)." % format_timespan(self.elapsed))
-                sys.stdout.flush()
+        if get_info("rich_text") and not get_info("building_doc"):
+            # New line, get back to previous line, and advance cursor to the end
+            # of the line. This allows us to always get back to the right cursor
+            # position, as long as the cursor is still in the correct line.
+            print("\n\033[1A\033[{}C".format(len(self._desc)), end="")
+        if fail:
+            msg = bold(red("failed"))
+            msg += " ({}).".format(format_timespan(self.elapsed))
+            pprint(msg)
+        else:
+            print("done (%s)." % format_timespan(self.elapsed))
+            sys.stdout.flush()
 
 
 class session_block:
@@ -55,14 +57,17 @@ class session_block:
         self._disable = disable
 
     def __enter__(self):
-        self._start = time()
-        msg = " {} starts ".format(self._session_name)
+        self._start = perf_counter()
         if not self._disable:
+            msg = " {} starts ".format(self._session_name)
             msg = wrap_text(msg, width())
             pprint(bold(blue(msg)))
 
     def __exit__(self, exception_type, *_):
-        elapsed = time() - self._start
+        if self._disable:
+            return
+
+        elapsed = perf_counter() - self._start
         fail = exception_type is not None
 
         if fail:
@@ -73,6 +78,5 @@ class session_block:
             color = blue
 
         msg = msg.format(self._session_name, elapsed)
-        if not self._disable:
-            msg = wrap_text(msg, width())
-            pprint(bold(color(msg)))
+        msg = wrap_text(msg, width())
+        pprint(bold(color(msg)))
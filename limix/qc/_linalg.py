@@ -2,32 +2,37 @@ def remove_dependent_cols(X, tol=1.49e-08):
     """
     Remove dependent columns.
 
-    Return a matrix with dependent columns removed.
+    Return a matrix with dependent columns removed. The numerical rank is revealed
+    by a column-pivoted QR decomposition, and columns are kept in their original
+    order.
 
     Parameters
     ----------
     X : array_like
         Matrix to might have dependent columns.
     tol : float, optional
-        Threshold above which columns are considered dependents.
+        Threshold, relative to the largest absolute diagonal entry of R, below
+        which columns are considered dependents.
 
     Returns
     -------
     rank : ndarray
-        Full column rank matrix.
+        Full column rank matrix. ``X`` itself is returned, without copying, if it
+        already has full column rank.
     """
+    import numpy as np
     from scipy.linalg import qr
-    from numpy import abs, asarray
-    from numpy import concatenate, full
 
-    X = asarray(X)
+    X = np.asarray(X)
     if X.shape[1] == 0:
         return X
 
-    r = max(X.shape[1] - X.shape[0], 0)
-    i = abs(qr(X, mode="r")[0].diagonal()) > tol
-    i = concatenate((i, full(r, True, bool)))
-    x = X[:, i]
-    if x.shape[1] == X.shape[1]:
+    # Column pivoting makes the absolute diagonal of R non-increasing, so the
+    # numerical rank is given by the number of entries above the cutoff.
+    R, piv = qr(X, mode="raw", pivoting=True)[1:]
+    d = np.abs(np.einsum("ii->i", R[:, : R.shape[0]]))
+    r = np.searchsorted(-d, -tol * d[0])
+    if r == X.shape[1]:
         return X
-    return remove_dependent_cols(x, tol)
+
+    return X[:, np.sort(piv[:r])]
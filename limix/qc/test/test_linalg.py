@@ -1,4 +1,5 @@
-from numpy import ones, zeros
+import pytest
+from numpy import nan, ones, zeros
 from numpy.random import RandomState
 from numpy.testing import assert_allclose
 
@@ -10,12 +11,13 @@ def test_remove_dependent_cols():
 
     X = random.randn(4, 5)
     X[:, 2] = 3 * X[:, 1]
-    D = X[:, [0, 1, 3, 4]]
+    D = X[:, [0, 2, 3, 4]]
     assert_allclose(remove_dependent_cols(X), D)
 
     X = random.randn(4, 1)
     R = X.copy()
     assert_allclose(remove_dependent_cols(X), R)
+    assert remove_dependent_cols(X) is X
 
     X = ones((3, 4))
     R = ones((3, 1))
@@ -24,3 +26,18 @@ def test_remove_dependent_cols():
     X = zeros((3, 4))
     R = zeros((3, 0))
     assert_allclose(remove_dependent_cols(X), R)
+
+    X = random.randn(100, 4)
+    X[:, 3] = (X[:, 0] - X[:, 2]) / 10
+    assert_allclose(remove_dependent_cols(X), X[:, :3])
+
+    X = random.randn(10, 3)
+    X[:, 1] = X[:, 0] / 2 + 1e-12 * X[:, 2]
+    assert_allclose(remove_dependent_cols(X), X[:, [0, 2]])
+
+
+def test_remove_dependent_cols_non_finite():
+    X = RandomState(0).randn(5, 3)
+    X[0, 0] = nan
+    with pytest.raises(ValueError):
+        remove_dependent_cols(X)
@@ -1,8 +1,9 @@
 import sys
+from collections.abc import Iterable
 
 from limix._display import session_line
 
-from .._bits import unvec
+from .._bits import cdot, unvec
 from .._data import asarray as _asarray, conform_dataset, normalize_likelihood
 from .._display import session_block
 from ._assert import assert_finite
@@ -92,8 +93,7 @@ def iscan(G, y, lik="normal", K=None, M=None, idx=None, E0=None, E1=None, verbos
     refer to the :func:`limix.qc.mean_impute` function for missing value imputation.
     """
     from numpy_sugar.linalg import economic_qs
-    from xarray import concat
-    from numpy import asarray, empty, ones
+    from numpy import asarray, concatenate, empty, ones
 
     lik = normalize_likelihood(lik)
     lik_name = lik[0]
@@ -120,17 +120,18 @@ def iscan(G, y, lik="normal", K=None, M=None, idx=None, E0=None, E1=None, verbos
 
         E0 = _asarray(E0, "env0", ["sample", "env"])
         E1 = _asarray(E1, "env1", ["sample", "env"])
-        E01 = concat([E0, E1], dim="env")
+        E01 = concatenate((E0.values, E1.values), axis=1)
 
         if K is not None:
             QS = economic_qs(K)
         else:
             QS = None
 
+        y = Y.values.reshape(-1)
         if lik_name == "normal":
-            scanner, v0, v1 = _lmm(Y.values.ravel(), M.values, QS, verbose)
+            scanner, v0, v1 = _lmm(y, M.values, QS, verbose)
         else:
-            scanner, v0, v1 = _glmm(Y.values.ravel(), lik, M.values, QS, verbose)
+            scanner, v0, v1 = _glmm(y, lik, M.values, QS, verbose)
 
         r = IScanResultFactory(
             lik_name,
@@ -146,6 +147,7 @@ def iscan(G, y, lik="normal", K=None, M=None, idx=None, E0=None, E1=None, verbos
             v1,
         )
 
+        Gd = G.data
         if idx is None:
 
             assert E1.shape[1] > 0
@@ -156,7 +158,7 @@ def iscan(G, y, lik="normal", K=None, M=None, idx=None, E0=None, E1=None, verbos
 
             for i in idx:
                 i = _2d_sel(i)
-                g = asarray(G[:, i], float)
+                g = asarray(Gd[:, i], float)
 
                 if E0.shape[1] > 0:
                     r1 = scanner.scan(g, E0)
@@ -172,7 +174,7 @@ def iscan(G, y, lik="normal", K=None, M=None, idx=None, E0=None, E1=None, verbos
         else:
             for i in idx:
                 i = _2d_sel(i)
-                g = asarray(G[:, i], float)
+                g = asarray(Gd[:, i], float)
 
                 r1 = scanner.scan(g, E0)
                 r2 = scanner.scan(g, E01)
@@ -200,10 +202,12 @@ def _normalise_scan_names(r):
 
 
 def _2d_sel(idx):
-    from collections.abc import Iterable
-
+    # A unit slice keeps the selection bidimensional while indexing a view.
     if not isinstance(idx, (slice, Iterable)):
-        return [idx]
+        if idx == -1:
+            # slice(-1, 0) would be empty: the last column runs to the end.
+            return slice(-1, None)
+        return slice(idx, idx + 1)
 
     return idx
 
@@ -211,6 +215,7 @@ def _2d_sel(idx):
 class ScannerWrapper:
     def __init__(self, scanner):
         self._scanner = scanner
+        self._null_beta_se = None
 
     @property
     def null_lml(self):
@@ -222,10 +227,12 @@ class ScannerWrapper:
 
     @property
     def null_beta_se(self):
-        from numpy import sqrt
+        if self._null_beta_se is None:
+            from numpy import einsum, sqrt
 
-        se = sqrt(self._scanner.null_beta_covariance.diagonal())
-        return se
+            cov = self._scanner.null_beta_covariance
+            self._null_beta_se = sqrt(einsum("ii->i", cov))
+        return self._null_beta_se
 
     def fast_scan(self, G, verbose):
         r = self._scanner.fast_scan(G, verbose=verbose)
@@ -234,8 +241,6 @@ class ScannerWrapper:
         return r
 
     def scan(self, G, E):
-        from .._bits import cdot
-
         r = self._scanner.scan(cdot(G, E))
         r["effsizes1"] = unvec(r["effsizes1"], (-1, G.shape[1])).T
         r["effsizes1_se"] = unvec(r["effsizes1_se"], (-1, G.shape[1])).T
@@ -247,7 +252,8 @@ def _lmm(y, M, QS, verbose):
 
     lmm = LMM(y, M, QS, restricted=False)
     lmm.fit(verbose=verbose)
-    sys.stdout.flush()
+    if verbose:
+        sys.stdout.flush()
 
     if QS is None:
         v0 = None
@@ -262,12 +268,14 @@ def _lmm(y, M, QS, verbose):
 def _glmm(y, lik, M, QS, verbose):
     from glimix_core.glmm import GLMMExpFam, GLMMNormal
 
-    glmm = GLMMExpFam(y.ravel(), lik, M, QS)
+    assert y.ndim == 1
+    glmm = GLMMExpFam(y, lik, M, QS)
 
     glmm.fit(verbose=verbose)
     v0 = glmm.v0
     v1 = glmm.v1
-    sys.stdout.flush()
+    if verbose:
+        sys.stdout.flush()
 
     eta = glmm.site.eta
     tau = glmm.site.tau
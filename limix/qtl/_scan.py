@@ -1,4 +1,5 @@
 import sys
+from collections.abc import Iterable
 
 from limix._display import session_line
 
@@ -6,6 +7,7 @@ from .._data import asarray as _asarray, conform_dataset, normalize_likelihood
 from .._display import session_block
 from ._assert import assert_finite
 from ._result import MTScanResultFactory, STScanResultFactory
+from ._result._tuples import VariantResult
 
 
 def scan(
@@ -278,6 +280,7 @@ def scan(
     refer to the :func:`limix.qc.mean_impute` function for missing value imputation.
     """
     from numpy_sugar.linalg import economic_qs
+    from numpy import ascontiguousarray
 
     lik = normalize_likelihood(lik)
 
@@ -297,6 +300,11 @@ def scan(
 
         assert_finite(Y, M, K)
 
+        # Convert the outcome and covariates to contiguous float arrays once here,
+        # rather than having every BLAS call along the fit copy them.
+        Y = Y.copy(deep=False, data=ascontiguousarray(Y.values, float))
+        M = M.copy(deep=False, data=ascontiguousarray(M.values, float))
+
         if K is not None:
             QS = economic_qs(K)
         else:
@@ -358,10 +366,11 @@ def _single_trait_scan(idx, lik, Y, M, G, QS, verbose):
     from numpy import asarray
     from tqdm import tqdm
 
+    y = Y.values.reshape(-1)
     if lik[0] == "normal":
-        scanner, v0, v1 = _st_lmm(Y.values.ravel(), M.values, QS, verbose)
+        scanner, v0, v1 = _st_lmm(y, M.values, QS, verbose)
     else:
-        scanner, v0, v1 = _st_glmm(Y.values.ravel(), lik, M.values, QS, verbose)
+        scanner, v0, v1 = _st_glmm(y, lik, M.values, QS, verbose)
     pass
 
     r = STScanResultFactory(
@@ -376,43 +385,67 @@ def _single_trait_scan(idx, lik, Y, M, G, QS, verbose):
         v1,
     )
 
+    # Index the underlying (numpy or dask) array instead of going through xarray
+    # label-based indexing for every test.
+    Gd = G.data
+
+    if idx is not None:
+        # idx might be a one-shot iterator and is walked more than once below.
+        idx = list(idx)
+
     if idx is None:
         r1 = scanner.fast_scan(G, verbose)
         for i in tqdm(range(G.shape[1]), "Results", disable=not verbose):
             h2 = _normalise_scan_names({k: v[i] for k, v in r1.items()})
             r.add_test(i, h2)
+    elif _single_candidates(idx):
+        # Every test has a single candidate: scan them all at once in chunks
+        # instead of solving one small system per candidate. The selection is
+        # left lazy for dask-backed genotypes, which are then loaded chunk by chunk.
+        r1 = scanner.fast_scan(Gd[:, idx], verbose)
+        for j, i in enumerate(tqdm(idx, "Results", disable=not verbose)):
+            h2 = _normalise_scan_names({k: v[j] for k, v in r1.items()})
+            r.add_test(i, h2)
     else:
         for i in tqdm(idx, "Results", disable=not verbose):
             i = _2d_sel(i)
-            h2 = _normalise_scan_names(scanner.scan(asarray(G[:, i], float)))
+            h2 = _normalise_scan_names(scanner.scan(asarray(Gd[:, i], float)))
             r.add_test(i, h2)
     return r
 
 
 def _multi_trait_scan(idx, lik, Y, M, G, QS, A, A0, A1, verbose):
-    from xarray import concat, DataArray
-    from numpy import eye, asarray, empty
+    from xarray import DataArray
+    from numpy import eye, asarray, empty, concatenate
     from tqdm import tqdm
 
     ntraits = Y.shape[1]
 
-    if A1 is None:
-        A1 = eye(ntraits)
-        A1 = DataArray(A1, dims=["sample", "env"], coords={"env": Y.trait.values})
-
+    # The default matrices are created already conformed, so only the ones given
+    # by the user go through normalisation.
     if A0 is None:
         A0 = empty((ntraits, 0))
-        A0 = DataArray(A0, dims=["sample", "env"], coords={"env": asarray([], str)})
-
-    A0 = _asarray(A0, "env0", ["sample", "env"])
-    if "env" not in A0.coords:
-        A0.coords["env"] = [f"env0_{i}" for i in range(A0.shape[1])]
+        A0 = DataArray(
+            A0, dims=["sample", "env"], coords={"env": asarray([], object)}, name="env0"
+        )
+    else:
+        A0 = _asarray(A0, "env0", ["sample", "env"])
+        if "env" not in A0.coords:
+            A0.coords["env"] = [f"env0_{i}" for i in range(A0.shape[1])]
 
-    A1 = _asarray(A1, "env1", ["sample", "env"])
-    if "env" not in A1.coords:
-        A1.coords["env"] = [f"env1_{i}" for i in range(A1.shape[1])]
+    if A1 is None:
+        A1 = eye(ntraits)
+        A1 = DataArray(
+            A1, dims=["sample", "env"], coords={"env": Y.trait.values}, name="env1"
+        )
+    else:
+        A1 = _asarray(A1, "env1", ["sample", "env"])
+        if "env" not in A1.coords:
+            A1.coords["env"] = [f"env1_{i}" for i in range(A1.shape[1])]
 
-    A01 = concat([A0, A1], dim="env")
+    # Only the values of A₀₁ are needed, so there is no point in building (and
+    # aligning) a new DataArray for it.
+    A01 = concatenate((A0.values, A1.values), axis=1)
 
     if lik[0] == "normal":
         scanner, C0, C1 = _mt_lmm(Y, A, M, QS, verbose)
@@ -437,11 +470,17 @@ def _multi_trait_scan(idx, lik, Y, M, G, QS, A, A0, A1, verbose):
 
     if idx is None:
         idx = range(G.shape[1])
+    elif not isinstance(idx, range):
+        # idx might be a one-shot iterator and is walked more than once below.
+        idx = list(idx)
 
-    for i in tqdm(idx, "Results", disable=not verbose):
+    Gd = G.data
+    if _single_candidates(idx):
+        tests = _candidate_blocks(Gd, idx)
+    else:
+        tests = ((i, asarray(Gd[:, i], float)) for i in map(_2d_sel, idx))
 
-        i = _2d_sel(i)
-        g = asarray(G[:, i], float)
+    for i, g in tqdm(tests, "Results", total=len(idx), disable=not verbose):
 
         if A0.shape[1] == 0:
             h1 = None
@@ -460,7 +499,8 @@ def _st_lmm(Y, M, QS, verbose):
 
     lmm = LMM(Y, M, QS, restricted=False)
     lmm.fit(verbose=verbose)
-    sys.stdout.flush()
+    if verbose:
+        sys.stdout.flush()
 
     if QS is None:
         v0 = nan
@@ -476,6 +516,7 @@ def _st_glmm(y, lik, M, QS, verbose):
     from numpy import nan
     from glimix_core.glmm import GLMMExpFam, GLMMNormal
 
+    assert y.ndim == 1
     glmm = GLMMExpFam(y, lik, M, QS)
 
     glmm.fit(verbose=verbose)
@@ -486,7 +527,8 @@ def _st_glmm(y, lik, M, QS, verbose):
         v0 = glmm.v0
 
     v1 = glmm.v1
-    sys.stdout.flush()
+    if verbose:
+        sys.stdout.flush()
 
     eta = glmm.site.eta
     tau = glmm.site.tau
@@ -505,11 +547,13 @@ def _mt_lmm(Y, A, M, QS, verbose):
     if QS is None:
         KG = zeros((Y.shape[0], 1))
     else:
-        KG = ddot(QS[0][0], sqrt(QS[1]))
+        # QS is not needed afterwards: scale Q₀ in place instead of copying it.
+        KG = ddot(QS[0][0], sqrt(QS[1]), out=QS[0][0])
 
     lmm = Kron2Sum(Y.values, A, M.values, KG, restricted=False)
     lmm.fit(verbose=verbose)
-    sys.stdout.flush()
+    if verbose:
+        sys.stdout.flush()
 
     C0 = lmm.C0
     C1 = lmm.C1
@@ -518,17 +562,38 @@ def _mt_lmm(Y, A, M, QS, verbose):
 
 
 def _2d_sel(idx):
-    from collections.abc import Iterable
-
+    # A unit slice keeps the selection bidimensional while indexing a view.
     if not isinstance(idx, (slice, Iterable)):
-        return [idx]
+        if idx == -1:
+            # slice(-1, 0) would be empty: the last column runs to the end.
+            return slice(-1, None)
+        return slice(idx, idx + 1)
 
     return idx
 
 
-def _normalise_scan_names(r):
-    from ._result._tuples import VariantResult
+def _candidate_blocks(G, idx, size=256):
+    from numpy import asarray
 
+    # Fetch candidates a block of columns at a time, which is much cheaper than
+    # one column at a time for dask-backed genotypes.
+    for start in range(0, len(idx), size):
+        cols = idx[start : start + size]
+        if isinstance(cols, range) and cols.start >= 0 and cols.step > 0:
+            # A slice would wrap around for negative or descending ranges.
+            sel = slice(cols.start, cols.stop, cols.step)
+        else:
+            sel = list(cols)
+        block = asarray(G[:, sel], float)
+        for j, i in enumerate(cols):
+            yield _2d_sel(i), block[:, j : j + 1]
+
+
+def _single_candidates(idx):
+    return all(not isinstance(i, (slice, Iterable)) for i in idx)
+
+
+def _normalise_scan_names(r):
     return VariantResult(
         lml=r["lml"],
         covariate_effsizes=r["effsizes0"],
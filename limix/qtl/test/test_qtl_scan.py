@@ -148,6 +148,41 @@ def test_qtl_scan_two_hypotheses_mt():
     str(r)
 
 
+def test_qtl_scan_mt_single_candidates():
+    import dask.array as da
+
+    random = RandomState(0)
+    n = 30
+    ntraits = 2
+    ncovariates = 3
+
+    A = random.randn(ntraits, ntraits)
+    A = A @ A.T
+    M = random.randn(n, ncovariates)
+    G = random.randn(n, 5)
+    A0 = random.randn(ntraits, 1)
+
+    K = random.randn(n, n + 1)
+    K = normalise_covariance(K @ K.T)
+
+    Y = random.randn(n, ntraits)
+
+    r0 = scan(G, Y, K=K, M=M, A=A, A0=A0, verbose=False)
+    r1 = scan(G, Y, idx=[[i] for i in range(5)], K=K, M=M, A=A, A0=A0, verbose=False)
+    r2 = scan(da.from_array(G, chunks=2), Y, K=K, M=M, A=A, A0=A0, verbose=False)
+    r3 = scan(G, Y, idx=[4, 1], K=K, M=M, A=A, A0=A0, verbose=False)
+    r4 = scan(G, Y, idx=range(4, -1, -1), K=K, M=M, A=A, A0=A0, verbose=False)
+    r5 = scan(G, Y, idx=range(-3, 0), K=K, M=M, A=A, A0=A0, verbose=False)
+    r6 = scan(G, Y, idx=(i for i in [4, 1]), K=K, M=M, A=A, A0=A0, verbose=False)
+
+    assert_allclose(r0.stats.values, r1.stats.values)
+    assert_allclose(r0.stats.values, r2.stats.values)
+    assert_allclose(r0.stats.values[[4, 1]], r3.stats.values)
+    assert_allclose(r0.stats.values[::-1], r4.stats.values)
+    assert_allclose(r0.stats.values[2:], r5.stats.values)
+    assert_allclose(r0.stats.values[[4, 1]], r6.stats.values)
+
+
 def test_qtl_scan_two_hypotheses_mt_A0A1_none():
     random = RandomState(0)
     n = 30
@@ -229,6 +264,29 @@ def test_qtl_scan_lmm_nokinship():
     assert_allclose(pv[:2], [8.159539103135342e-05, 0.10807353641893498], atol=1e-5)
 
 
+def test_qtl_scan_lmm_single_candidates():
+    random = RandomState(0)
+    nsamples = 50
+
+    G = random.randn(50, 100)
+    K = linear_kinship(G[:, 0:80], verbose=False)
+
+    y = dot(G, random.randn(100)) / sqrt(100) + 0.2 * random.randn(nsamples)
+
+    X = G[:, 66:70]
+
+    r0 = scan(X, y, "normal", K, idx=[3, 0, 2], verbose=False)
+    r1 = scan(X, y, "normal", K, idx=[[3], [0], [2]], verbose=False)
+    assert_allclose(r0.stats.values, r1.stats.values)
+    r2 = scan(X, y, "normal", K, idx=(i for i in [3, 0, 2]), verbose=False)
+    assert_allclose(r0.stats.values, r2.stats.values)
+    e0 = r0.effsizes["h2"]
+    e1 = r1.effsizes["h2"]
+    assert_array_equal(e0["effect_name"], e1["effect_name"])
+    assert_allclose(e0["effsize"], e1["effsize"])
+    assert_allclose(e0["effsize_se"], e1["effsize_se"])
+
+
 def test_qtl_scan_lmm_repeat_samples_by_index():
     random = RandomState(0)
     nsamples = 30